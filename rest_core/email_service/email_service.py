@@ -6,18 +6,28 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.mail import EmailMultiAlternatives
 from django.core.validators import validate_email
-from django.template.loader import render_to_string
+from django.template.loader import get_template
 
 from .exceptions import EmailsError, TemplatesError
 from .models import Emails, Templates
 from .types import SendStatusTyped
-from .validators import EmailServiceValidator
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
 DEFAULT_FROM_EMAIL = settings.DEFAULT_FROM_EMAIL
 
+# Compiled templates keyed by template name, shared across sends
+_TEMPLATE_CACHE: dict[str, Any] = {}
+
+
+def _get_template(template_name: str) -> Any:
+    """Load and compile a template once, then reuse it for every send."""
+    template = _TEMPLATE_CACHE.get(template_name)
+    if template is None:
+        template = _TEMPLATE_CACHE[template_name] = get_template(template_name)
+    return template
+
 
 class EmailService:
     def __init__(
@@ -28,27 +38,14 @@ class EmailService:
         templates: Templates,
     ) -> None:
         # validate all email credentials
-        validator = EmailServiceValidator()
-        validator.validate(
-            data=emails,
-            excepted_data_class=Emails,
-            exception_class=EmailsError,
-            message="Invalid emails credentials",
-        )
+        if not isinstance(emails, Emails):
+            raise EmailsError("Invalid emails credentials")
 
-        validator.validate(
-            data=context,
-            excepted_data_class=dict,
-            exception_class=TypeError,
-            message="Invalid context credentials",
-        )
+        if not isinstance(context, dict):
+            raise TypeError("Invalid context credentials")
 
-        validator.validate(
-            data=templates,
-            excepted_data_class=Templates,
-            exception_class=TemplatesError,
-            message="Invalid templates credentials",
-        )
+        if not isinstance(templates, Templates):
+            raise TemplatesError("Invalid templates credentials")
 
         self.subject = subject
         self.emails = emails
@@ -70,11 +67,13 @@ class EmailService:
         try:
             self._send_email()
         except (SMTPException, ValidationError) as error:
-            logger.error(f"Error sending email to {self.unique_to_emails}: {error}")
+            logger.error(
+                "Error sending email to %s: %s", self.unique_to_emails, error
+            )
             if fallback:
                 self._send_fallback_email()
         except Exception as error:
-            logger.exception(f"Unexpected error while sending email: {error}")
+            logger.exception("Unexpected error while sending email: %s", error)
             if fallback:
                 self._send_fallback_email()
 
@@ -109,11 +108,15 @@ class EmailService:
 
     def _render_templates(self) -> tuple[str, str]:
         try:
-            text_content = render_to_string(self.templates.text_template, self.context)
-            html_content = render_to_string(self.templates.html_template, self.context)
+            text_content = _get_template(self.templates.text_template).render(
+                self.context
+            )
+            html_content = _get_template(self.templates.html_template).render(
+                self.context
+            )
             return text_content, html_content
         except Exception as error:
-            logger.error(f"Template rendering failed: {error}")
+            logger.error("Template rendering failed: %s", error)
             raise TemplatesError("Template rendering failed.")
 
     def _send_email(self) -> None:
@@ -129,7 +132,9 @@ class EmailService:
         email.send()
 
         self.email_sends = self.unique_to_emails
-        logger.info(f"Email sent successfully to: {', '.join(self.unique_to_emails)}")
+        logger.info(
+            "Email sent successfully to: %s", ", ".join(self.unique_to_emails)
+        )
 
     def _send_fallback_email(self) -> None:
         try:
@@ -145,6 +150,6 @@ class EmailService:
             fallback_email.send()
 
             self.fallback_email_sends = [self.from_email]
-            logger.info(f"Fallback email sent to: {self.from_email}")
+            logger.info("Fallback email sent to: %s", self.from_email)
         except Exception as error:
-            logger.error(f"Error sending fallback email: {error}")
+            logger.error("Error sending fallback email: %s", error)
@@ -35,6 +35,6 @@ class ResponseTimeMiddleware:
         response_time = f"{round(end_time - start_time, 6)} seconds"
         response["X-Response-Time"] = response_time
 
-        logger.info(f"Request processed in {response_time}")
+        logger.info("Request processed in %s", response_time)
 
         return response
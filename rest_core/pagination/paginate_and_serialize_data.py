@@ -69,5 +69,5 @@ def paginate_and_serialize_data(
         "results": serializer.data,
     }
 
-    logger.debug(f"Pagination result: {response_data}")
+    logger.debug("Pagination result: %s", response_data)
     return response_data
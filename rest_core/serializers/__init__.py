@@ -0,0 +1,11 @@
+from .mixins import FieldsCacheMixin, FileFieldUrlMixin, RecordsCreationMixin
+from .serializers import BulkListSerializer, ModelSerializer, Serializer
+
+__all__ = [
+    "Serializer",
+    "ModelSerializer",
+    "BulkListSerializer",
+    "FieldsCacheMixin",
+    "FileFieldUrlMixin",
+    "RecordsCreationMixin",
+]
@@ -1,4 +1,5 @@
+from .fields_cache_mixin import FieldsCacheMixin
 from .file_field_url_mixin import FileFieldUrlMixin
 from .records_creation_mixin import RecordsCreationMixin
 
-__all__ = ["FileFieldUrlMixin", "RecordsCreationMixin"]
+__all__ = ["FieldsCacheMixin", "FileFieldUrlMixin", "RecordsCreationMixin"]
@@ -0,0 +1,33 @@
+import copy
+from typing import Any
+
+from rest_framework.relations import ManyRelatedField
+from rest_framework.serializers import BaseSerializer, Field
+
+
+class FieldsCacheMixin:
+    """
+    A mixin that builds a serializer's fields once per class and hands each
+    instance its own copies, instead of re-introspecting the model and
+    re-creating every Field on each instantiation.
+
+    Only use it on serializers whose `get_fields` does not depend on the
+    instance (e.g. fields picked from the request or context).
+    """
+
+    def get_fields(self) -> dict[str, Field]:
+        cls = type(self)
+        cached: dict[str, Field] | None = cls.__dict__.get("_cached_fields")
+        if cached is None:
+            cached = super().get_fields()  # type: ignore
+            cls._cached_fields = cached  # type: ignore[attr-defined]
+        return {name: self._copy_field(field) for name, field in cached.items()}
+
+    @staticmethod
+    def _copy_field(field: Any) -> Any:
+        # Nested serializers and many-related fields bind a child to
+        # themselves, so they need a full copy to keep the child's parent
+        # (and therefore its context) pointing at the new instance.
+        if isinstance(field, (BaseSerializer, ManyRelatedField)):
+            return copy.deepcopy(field)
+        return copy.copy(field)
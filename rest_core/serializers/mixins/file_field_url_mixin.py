@@ -80,14 +80,14 @@ class FileFieldUrlMixin:
                     if request:
                         file_url = request.build_absolute_uri(file_url)
                     representation[field_name] = file_url
-                    logger.debug(f"Enhanced URL for {field_name}: {file_url}")
+                    logger.debug("Enhanced URL for %s: %s", field_name, file_url)
                 else:
                     representation[field_name] = None
-                    logger.info(f"No file found for field: {field_name}")
+                    logger.info("No file found for field: %s", field_name)
 
             except Exception as error:
                 logger.error(
-                    f"Unexpected error processing file field {field_name}: {error}"
+                    "Unexpected error processing file field %s: %s", field_name, error
                 )
 
         return representation
@@ -1,21 +1,47 @@
 import logging
+from functools import lru_cache
 from typing import Any, Optional, Type
 
-from django.core.exceptions import FieldDoesNotExist
 from django.db.models import Model
 from rest_framework.serializers import Field
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _model_error_messages(model: Type[Model]) -> dict[str, dict[str, Any]]:
+    """
+    Build the ``{field_name: error_messages}`` mapping for a model once.
+
+    Forward fields are also keyed by their attname (e.g. ``user_id``) so
+    lookups behave like ``model._meta.get_field``.
+    """
+    messages: dict[str, dict[str, Any]] = {}
+    for model_field in model._meta.get_fields():
+        error_messages = getattr(model_field, "error_messages", None)
+        if error_messages is None:
+            continue
+        messages[model_field.name] = dict(error_messages)
+        attname = getattr(model_field, "attname", None)
+        if attname:
+            messages.setdefault(attname, messages[model_field.name])
+    return messages
+
+
 class RecordsCreationMixin:
     Meta: Optional[Type] = None
     file_fields: list[str] | None = None
+    # Rows per statement when bulk writing; None sends them all in one
+    bulk_batch_size: int | None = None
 
     def create(self, validated_data) -> Any:
-        logger.debug(f"Starting creation with validated_data: {validated_data}")
         extra_fields = self.context.get("extra_fields", {})  # type: ignore
-        logger.debug(f"Extra fields from context: {extra_fields}")
+
+        # Avoid formatting large payloads when debug logging is disabled
+        is_debug = logger.isEnabledFor(logging.DEBUG)
+        if is_debug:
+            logger.debug("Starting creation with validated_data: %s", validated_data)
+            logger.debug("Extra fields from context: %s", extra_fields)
 
         model = getattr(self.Meta, "model", None)
         if model is None:
@@ -25,19 +51,22 @@ class RecordsCreationMixin:
         valid_extra_fields = {
             k: v for k, v in extra_fields.items() if hasattr(model, k)
         }
-        logger.debug(f"Valid extra fields: {valid_extra_fields}")
+        if is_debug:
+            logger.debug("Valid extra fields: %s", valid_extra_fields)
 
         if isinstance(validated_data, list):
             instances = [model(**valid_extra_fields, **item) for item in validated_data]
             if instances:
                 logger.info(
-                    f"Bulk creating {len(instances)} {model.__name__} instances."
+                    "Bulk creating %d %s instances.", len(instances), model.__name__
+                )
+                return model.objects.bulk_create(
+                    instances, batch_size=self.bulk_batch_size
                 )
-                return model.objects.bulk_create(instances)
             logger.info("No instances to create.")
             return []
 
-        logger.info(f"Creating a single instance of {model.__name__}")
+        logger.info("Creating a single instance of %s", model.__name__)
         return super().create({**valid_extra_fields, **validated_data})  # type: ignore
 
     def get_fields(self) -> dict[str, Field]:
@@ -48,14 +77,17 @@ class RecordsCreationMixin:
         if model is None:
             raise ValueError("Meta.model must be defined.")
 
-        logger.debug(f"Setting up fields for {model.__name__}")
+        is_debug = logger.isEnabledFor(logging.DEBUG)
+        if is_debug:
+            logger.debug("Setting up fields for %s", model.__name__)
+
+        model_error_messages = _model_error_messages(model)
 
         for field_name, field in fields.items():
-            try:
-                model_field = model._meta.get_field(field_name)  # type: ignore
-                if hasattr(model_field, "error_messages"):
-                    field.error_messages.update(model_field.error_messages)
-            except FieldDoesNotExist:
-                logger.debug(f"Skipping unknown field '{field_name}'")
+            error_messages = model_error_messages.get(field_name)
+            if error_messages is not None:
+                field.error_messages.update(error_messages)
+            elif is_debug:
+                logger.debug("Skipping unknown field '%s'", field_name)
 
         return fields
@@ -0,0 +1,94 @@
+from typing import Any, Mapping
+
+from django.db.models import Model
+from rest_framework.serializers import ListSerializer
+from rest_framework.serializers import ModelSerializer as DrfModelSerializer
+from rest_framework.serializers import Serializer as DrfSerializer
+
+from .mixins import FieldsCacheMixin, FileFieldUrlMixin, RecordsCreationMixin
+
+
+class Serializer(FileFieldUrlMixin, DrfSerializer):
+    """
+    DRF Serializer with absolute URLs for manually declared `file_fields`.
+    """
+
+    ...
+
+
+class ModelSerializer(
+    FieldsCacheMixin, RecordsCreationMixin, FileFieldUrlMixin, DrfModelSerializer
+):
+    """
+    DRF ModelSerializer with per-class field caching, extra fields, bulk
+    creation, model error message syncing and absolute file/image field URLs.
+    """
+
+    ...
+
+
+class BulkListSerializer(ListSerializer):
+    """
+    ListSerializer that writes a whole list in bulk:
+
+    - `create` hands the validated list to the child's `create`, so a
+      `RecordsCreationMixin` child inserts it with a single `bulk_create`.
+    - `update` applies each item to the matching instance and saves them
+      all with one `bulk_update`. Pass the instances as a list in the same
+      order as the data; each item is validated against its instance.
+
+    Per-item validators only see the database, not the other items, so
+    subclasses must check unique constraints across the whole payload.
+
+    Set it as `Meta.list_serializer_class` on the child serializer.
+    """
+
+    def get_item_instance(self, data: Any) -> Model | None:
+        """Returns the instance a list item updates, matched by its `id`."""
+        if not isinstance(self.instance, list) or not isinstance(data, Mapping):
+            return None
+        instances = self.__dict__.get("_instances_by_pk")
+        if instances is None:
+            instances = {str(obj.pk): obj for obj in self.instance}
+            self._instances_by_pk = instances
+        return instances.get(str(data.get("id")))
+
+    def run_child_validation(self, data: Any) -> Any:
+        # Validate each item against its own instance (e.g. for unique checks)
+        if isinstance(self.instance, list):
+            self.child.instance = self.get_item_instance(data)
+        try:
+            return super().run_child_validation(data)
+        finally:
+            if isinstance(self.instance, list):
+                self.child.instance = None
+
+    def create(self, validated_data: list[dict[str, Any]]) -> Any:
+        if isinstance(self.child, RecordsCreationMixin):
+            return self.child.create(validated_data)
+        return super().create(validated_data)
+
+    def update(
+        self, instance: list[Model], validated_data: list[dict[str, Any]]
+    ) -> Any:
+        model = self.child.Meta.model  # type: ignore[attr-defined]
+        fields: set[str] = set()
+        for obj, attrs in zip(instance, validated_data):
+            for attr, value in attrs.items():
+                setattr(obj, attr, value)
+            fields.update(attrs)
+
+        # bulk_update skips save(), so refresh auto_now fields by hand
+        for field in model._meta.concrete_fields:
+            if getattr(field, "auto_now", False):
+                for obj in instance:
+                    field.pre_save(obj, add=False)
+                fields.add(field.name)
+
+        if fields:
+            model.objects.bulk_update(
+                instance,
+                list(fields),
+                batch_size=getattr(self.child, "bulk_batch_size", None),
+            )
+        return instance
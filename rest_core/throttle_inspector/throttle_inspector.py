@@ -10,6 +10,23 @@ from rest_framework.throttling import BaseThrottle
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Header names per throttle scope, built on first use and reused afterwards
+_HEADER_KEYS: Dict[str, Tuple[str, str, str, str]] = {}
+
+
+def _get_header_keys(throttle_type: str) -> Tuple[str, str, str, str]:
+    """Returns the (limit, remaining, reset, retry-after) header names for a scope."""
+    keys = _HEADER_KEYS.get(throttle_type)
+    if keys is None:
+        prefix = f"X-Throttle-{throttle_type}"
+        keys = _HEADER_KEYS[throttle_type] = (
+            f"{prefix}-Limit",
+            f"{prefix}-Remaining",
+            f"{prefix}-Reset",
+            f"{prefix}-Retry-After",
+        )
+    return keys
+
 
 class ThrottleInspector:
     """
@@ -30,11 +47,12 @@ class ThrottleInspector:
 
         if not self.throttle_classes:
             logger.info(
-                f"No throttles configured for {type(view_instance).__name__}. Returning empty response."
+                "No throttles configured for %s. Returning empty response.",
+                type(view_instance).__name__,
             )
         if not self.request:
             logger.warning(
-                f"Request object is missing in {type(view_instance).__name__}."
+                "Request object is missing in %s.", type(view_instance).__name__
             )
 
     @staticmethod
@@ -60,13 +78,13 @@ class ThrottleInspector:
     ) -> Optional[Tuple[int, int]]:
         scope = getattr(throttle_class, "scope", None)
         if not scope:
-            logger.warning(f"No scope defined in {throttle_class.__name__}. Skipping.")
+            logger.warning("No scope defined in %s. Skipping.", throttle_class.__name__)
             return None
 
         rate = settings.REST_FRAMEWORK.get("DEFAULT_THROTTLE_RATES", {}).get(scope)
 
         if not rate:
-            logger.warning(f"No rate limit found for scope '{scope}'. Skipping.")
+            logger.warning("No rate limit found for scope '%s'. Skipping.", scope)
 
         return self.parse_rate(rate)
 
@@ -126,7 +144,7 @@ class ThrottleInspector:
 
             if throttle_usage["remaining"] == 0 and not details["throttled_by"]:
                 details["throttled_by"] = scope
-                logger.info(f"Request throttled by {scope}")
+                logger.info("Request throttled by %s", scope)
 
         return details
 
@@ -136,9 +154,12 @@ class ThrottleInspector:
             return None
 
         for throttle_type, data in throttle_details.get("throttles", {}).items():
-            response[f"X-Throttle-{throttle_type}-Limit"] = str(data["limit"])
-            response[f"X-Throttle-{throttle_type}-Remaining"] = str(data["remaining"])
-            response[f"X-Throttle-{throttle_type}-Reset"] = data["reset_time"]
-            response[f"X-Throttle-{throttle_type}-Retry-After"] = data["retry_after"]
+            limit_key, remaining_key, reset_key, retry_key = _get_header_keys(
+                throttle_type
+            )
+            response[limit_key] = str(data["limit"])
+            response[remaining_key] = str(data["remaining"])
+            response[reset_key] = data["reset_time"]
+            response[retry_key] = data["retry_after"]
 
         logger.info("Throttle headers attached to response.")
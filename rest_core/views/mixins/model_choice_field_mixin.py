@@ -1,7 +1,17 @@
-from typing import Iterable, Tuple, cast
+from types import MappingProxyType
+from typing import Mapping, Sequence
 
+from django.core.exceptions import FieldDoesNotExist
 from django.db.models import Model
 
+# Read-only mapping of field name => (value => label)
+ChoiceFields = Mapping[str, Mapping[str, str]]
+
+# Resolved choices keyed by (model, choice_fields); model choices are fixed
+# at class definition time, so they only need to be built once. Entries are
+# read-only views, so the same object can be handed to every caller.
+_CHOICES_CACHE: dict[tuple[type[Model], tuple[str, ...]], ChoiceFields] = {}
+
 
 class ModelAttributeNotFound(Exception):
     """
@@ -37,15 +47,21 @@ class ModelChoiceFieldMixin:
     """Mixin to retrieve choice fields from a Django model."""
 
     model: type[Model] | None = None
-    choice_fields: list[str] | None = None
+    choice_fields: Sequence[str] | None = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Freeze the declared fields so they can be used as a cache key as is
+        if cls.choice_fields is not None:
+            cls.choice_fields = tuple(cls.choice_fields)
 
-    def get_choice_fields(self) -> dict[str, dict[str, str]]:
+    def get_choice_fields(self) -> ChoiceFields:
         """
         Retrieve the choice fields from the queryset model class.
 
         Returns:
-            dict[str, dict[str, str]]: A dictionary where keys are field names
-            and values are dictionaries of choices (value => label).
+            ChoiceFields: A read-only mapping where keys are field names
+            and values are read-only mappings of choices (value => label).
 
         Raises:
             ModelAttributeNotFound: If the model attribute is not set.
@@ -61,33 +77,53 @@ class ModelChoiceFieldMixin:
                 "The choice_fields attribute must be set in the class."
             )
 
-        choices_as_dict: dict[str, dict[str, str]] = {}
-
-        for field in self.choice_fields:
-            try:
-                field_obj = self.model._meta.get_field(field)
-                raw_choices = cast(Iterable[Tuple[str, str]], field_obj.choices or [])
-
-                # Validate choice structure
-                if not all(
-                    isinstance(choice, (list, tuple)) and len(choice) == 2
-                    for choice in raw_choices
-                ):
+        # Configured but empty: nothing to resolve
+        if not self.choice_fields:
+            return {}
+
+        model = self.model
+        choice_fields = self.choice_fields
+
+        # tuple() returns frozen class-level fields unchanged
+        cache_key = (model, tuple(choice_fields))
+        cached = _CHOICES_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        model_name = model.__name__
+        get_field = model._meta.get_field
+        # Choice fields are concrete forward fields, so try Django's prebuilt
+        # name -> field map first and fall back to get_field() for the rest.
+        forward_fields = getattr(model._meta, "_forward_fields_map", None) or {}
+        choices_as_dict: dict[str, Mapping[str, str]] = {}
+
+        for field in choice_fields:
+            field_obj = forward_fields.get(field)
+            if field_obj is None:
+                try:
+                    field_obj = get_field(field)
+                except FieldDoesNotExist as error:
                     raise ChoiceFieldNotFound(
-                        f"The field '{field}' in model '{self.model.__name__}' has invalid choice format. "
-                        "Expected an iterable of 2-tuples (value, label)."
-                    )
+                        f"The field '{field}' is not found in the model '{model_name}'."
+                    ) from error
 
-                if not raw_choices:
-                    raise ChoiceFieldNotFound(
-                        f"The field '{field}' in model '{self.model.__name__}' has no choices defined."
-                    )
+            raw_choices = field_obj.choices
 
-                choices_as_dict[field] = dict(raw_choices)
+            if not raw_choices:
+                raise ChoiceFieldNotFound(
+                    f"The field '{field}' in model '{model_name}' has no choices defined."
+                )
 
-            except Exception as error:
+            # Build and validate the choice structure in a single pass
+            try:
+                field_choices = {value: label for value, label in raw_choices}
+            except (TypeError, ValueError) as error:
                 raise ChoiceFieldNotFound(
-                    f"The field '{field}' is not found or has invalid choices in the model '{self.model.__name__}'."
+                    f"The field '{field}' in model '{model_name}' has invalid choice format. "
+                    "Expected an iterable of 2-tuples (value, label)."
                 ) from error
 
-        return choices_as_dict
+            choices_as_dict[field] = MappingProxyType(field_choices)
+
+        frozen = _CHOICES_CACHE[cache_key] = MappingProxyType(choices_as_dict)
+        return frozen
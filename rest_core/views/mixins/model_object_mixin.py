@@ -1,10 +1,26 @@
-from typing import Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from django.db.models import Model, QuerySet
 
 # Define a generic type variable bound to Django Model
 ModelType = TypeVar("ModelType", bound=Model)
 
+if TYPE_CHECKING:
+    from typing import Generic
+
+    class _ModelTypeBase(Generic[ModelType]): ...
+
+else:
+
+    class _ModelTypeBase:
+        """
+        Runtime stand-in for Generic[ModelType]. The type parameter is only
+        used by static type checkers, so subscripting returns the class as is.
+        """
+
+        def __class_getitem__(cls, item: Any) -> type:
+            return cls
+
 
 class QuerysetAttributeNotFound(Exception):
     """
@@ -16,7 +32,7 @@ class QuerysetAttributeNotFound(Exception):
     ...
 
 
-class ModelObjectMixin(Generic[ModelType]):
+class ModelObjectMixin(_ModelTypeBase[ModelType]):
     """
     Mixin to provide a method for retrieving a model object by its attributes.
     This mixin is intended to be used in Django views or viewsets.
@@ -68,8 +84,51 @@ class ModelObjectMixin(Generic[ModelType]):
                 "Queryset attribute is not set in the class."
             )
 
+        # Primary key lookups can only match one row, so skip get()'s
+        # multiple-objects check and the DoesNotExist exception on a miss
+        if len(kwargs) == 1 and next(iter(kwargs)) in ("pk", "id"):
+            return self.queryset.filter(**kwargs).first()
+
         # Attempt to retrieve the object using the provided keyword arguments
         try:
             return self.queryset.get(**kwargs)
         except self.queryset.model.DoesNotExist:
             return None
+
+    def get_object_values(
+        self, fields: tuple[str, ...] | None = None, **kwargs: Any
+    ) -> dict[str, Any] | None:
+        """
+        Retrieve a model row as a plain dictionary based on the provided
+        keyword arguments. If no row matches, return None.
+
+        Use this instead of `get_object` when the caller only needs the
+        column values (e.g. to serialize them), as it skips model
+        instantiation entirely.
+
+        param fields:
+            - Optional field names to select. All concrete fields if omitted.
+        param kwargs:
+            - Keyword arguments to filter the model row.
+        return:
+            - A dictionary of field values if found, otherwise None.
+        raise QuerysetAttributeNotFound:
+            - If the queryset attribute is not set in the class.
+        Example usage:
+        ```
+            def get(self, request, *args, **kwargs) -> JsonResponse:
+                data = self.get_object_values(("id", "title"), id=1)
+                if data is None:
+                    return JsonResponse({"error": "Object not found"}, status=404)
+                return JsonResponse(data)
+        ```
+        """
+        # Check if the queryset attribute is set
+        if self.queryset is None:
+            raise QuerysetAttributeNotFound(
+                "Queryset attribute is not set in the class."
+            )
+
+        queryset = self.queryset.filter(**kwargs)
+        values = queryset.values(*fields) if fields else queryset.values()
+        return values.first()
@@ -11,6 +11,16 @@ class ModelChoiceFieldAPIView(ModelChoiceFieldMixin, APIView):
     Inherits from ModelChoiceFieldMixin and APIView.
     """
 
+    # Success message, built once per subclass from its model
+    _success_message: str = "Choice fields retrieved successfully"
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.model is not None:
+            cls._success_message = (
+                f"{cls.model.__name__} choice fields retrieved successfully"
+            )
+
     def get(self, request) -> Response:
         """
         Handle GET requests to retrieve choice fields.
@@ -29,6 +39,6 @@ class ModelChoiceFieldAPIView(ModelChoiceFieldMixin, APIView):
 
         # Return a success response with the choice fields
         return success_response(
-            message=f"{self.model.__name__} choice fields retrieved successfully",
-            data=choice_fields,
+            message=self._success_message,
+            data=choice_fields,  # type: ignore[arg-type]
         )
@@ -4,6 +4,16 @@ from rest_framework.response import Response
 from rest_framework.status import is_success
 
 
+# Action inferred from the HTTP method; GET is resolved separately because it
+# depends on whether the view is a detail view.
+_METHOD_TO_ACTION: dict[str, str] = {
+    "POST": "create",
+    "PUT": "update",
+    "PATCH": "partial_update",
+    "DELETE": "destroy",
+}
+
+
 class ActionMessages(TypedDict, total=False):
     list: str
     retrieve: str
@@ -50,58 +60,70 @@ class ActionMessageMixin:
         "errors": {},
     }
 
+    # Per-class merge of default_messages and messages, see _get_merged_messages
+    _merged_messages_cache: MessagesDict
+
+    # Whether the view class defines a callable get_object, set per subclass
+    _has_get_object: bool = False
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._has_get_object = callable(getattr(cls, "get_object", None))
+
+    @classmethod
+    def _get_merged_messages(cls) -> MessagesDict:
+        """
+        Merge default and custom messages once per class and reuse the result.
+        The cache lives in the class __dict__ so subclasses build their own.
+        """
+        merged = cls.__dict__.get("_merged_messages_cache")
+        if merged is None:
+            merged = {
+                "actions": {
+                    **cls.default_messages["actions"],
+                    **(cls.messages.get("actions") or {}),
+                },
+                "errors": {
+                    **cls.default_messages["errors"],
+                    **(cls.messages.get("errors") or {}),
+                },
+            }
+            cls._merged_messages_cache = merged
+        return merged
+
     @property
     def merged_messages(self) -> MessagesDict:
-        return {
-            "actions": {
-                **self.default_messages["actions"],
-                **(self.messages.get("actions") or {}),
-            },
-            "errors": {
-                **self.default_messages["errors"],
-                **(self.messages.get("errors") or {}),
-            },
-        }
+        return type(self)._get_merged_messages()
 
     def get_action_type(self, request) -> str | None:
         """Determine the action based on HTTP method and view context."""
-        method = request.method.lower()
-        if method == "get":
-            if hasattr(self, "get_object") and callable(
-                getattr(self, "get_object", None)
-            ):
-                return "retrieve"
-            return "list"
-        elif method == "post":
-            return "create"
-        elif method == "put":
-            return "update"
-        elif method == "patch":
-            return "partial_update"
-        elif method == "delete":
-            return "destroy"
-        return None
+        method = request.method
+        if method == "GET":
+            return "retrieve" if self._has_get_object else "list"
+        return _METHOD_TO_ACTION.get(method)
 
     def finalize_response(self, request, response, *args, **kwargs) -> Response:
         response = super().finalize_response(request, response, *args, **kwargs)  # type: ignore
 
         # Determine action from attribute or fallback
         action = getattr(self, "action", None) or self.get_action_type(request)
-        messages = self.merged_messages
-
-        if response.status_code == 404 and getattr(response, "exception", False):
-            msg = messages["errors"].get("not_found")
-            if msg:
-                response.message = msg
-            return response
-
-        if response.status_code == 400 and getattr(response, "exception", False):
-            msg = messages["errors"].get("validation_error")
+        messages = type(self)._get_merged_messages()
+
+        status_code = response.status_code
+
+        # Exception responses are never 2xx, so only error messages apply
+        if getattr(response, "exception", False):
+            if status_code == 404:
+                msg = messages["errors"].get("not_found")
+            elif status_code == 400:
+                msg = messages["errors"].get("validation_error")
+            else:
+                msg = None
             if msg:
                 response.message = msg
             return response
 
-        if is_success(response.status_code) and action:
+        if is_success(status_code) and action:
             msg = messages["actions"].get(action)
             if msg:
                 response.message = msg
@@ -1,17 +1,29 @@
+import hashlib
+import json
 import logging
-from typing import Iterable, Tuple, cast
+from types import MappingProxyType
+from typing import Mapping, Sequence
 
 from django.core.exceptions import FieldDoesNotExist
 from django.db.models import Model
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 
 from rest_core.response import failure_response, success_response
+from rest_core.views.mixins import ChoiceFieldNotFound
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Fixed response payloads for choice_fields_action, built once at import
+_NO_FIELDS_MESSAGE = "No choice fields found."
+_NO_FIELDS_DATA = {"detail": _NO_FIELDS_MESSAGE}
+_CHOICE_FAILURE_ERRORS = {"detail": "Failed to retrieve choice fields."}
+_UNEXPECTED_ERRORS = {"detail": "An unexpected error occurred."}
+
 
 class MissingChoiceFieldsConfig(Exception):
     """Raised when no choice fields are configured on the viewset."""
@@ -19,27 +31,50 @@ class MissingChoiceFieldsConfig(Exception):
     pass
 
 
-class ChoiceFieldNotFound(Exception):
-    """Raised when a specified field does not exist or has no choices."""
-
-    pass
-
-
 class ModelChoiceFieldActionMixin:
     """
     Mixin to expose a `choice-fields/` endpoint on a DRF ViewSet.
     Automatically gets the model from the queryset.
     """
 
-    choice_fields: list[str] = []
+    choice_fields: Sequence[str] | None = ()
+
+    # Model inferred from the queryset, cached per view class by get_model
+    _resolved_model: type[Model]
+
+    # (choice_fields, choices) built once per view class by get_choice_fields
+    _choice_fields_cache: tuple[Sequence[str], Mapping[str, Mapping[str, str]]]
+
+    # (choice_fields, etag) built once per view class by get_choice_fields_etag
+    _choice_fields_etag: tuple[Sequence[str], str]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Freeze the declared fields so they are immutable per class; None is
+        # left as is and reported as MissingChoiceFieldsConfig on request
+        if cls.choice_fields is not None:
+            cls.choice_fields = tuple(cls.choice_fields)
 
     def get_model(self) -> type[Model]:
         """
         Retrieves the model class from the queryset.
+        The model is resolved once per view class and reused afterwards.
         """
+        cls = type(self)
+        model = cls.__dict__.get("_resolved_model")
+        if model is not None:
+            return model
+
+        # Read the class queryset's model directly when one is declared,
+        # skipping get_queryset() and any filtering it applies
+        queryset = getattr(self, "queryset", None)
         try:
-            model = self.get_queryset().model  # type: ignore[return-value]
-            logger.debug(f"Inferred model from queryset: {model}")
+            if queryset is not None:
+                model = queryset.model
+            else:
+                model = self.get_queryset().model  # type: ignore[attr-defined]
+            logger.debug("Inferred model from queryset: %s", model)
+            cls._resolved_model = model
             return model
         except (AttributeError, AssertionError) as e:
             logger.exception("Failed to infer model from queryset.")
@@ -47,11 +82,41 @@ class ModelChoiceFieldActionMixin:
                 "Could not infer model from queryset. Ensure 'queryset' is set."
             ) from e
 
-    def get_choice_fields(self) -> dict[str, dict[str, str]]:
+    def get_choice_fields(self) -> Mapping[str, Mapping[str, str]]:
         """
         Extracts choice fields from the model.
+        Choices are static model metadata, so they are built once per view
+        class and the same read-only mapping is returned afterwards.
         Returns:
-            A dictionary mapping field names to their available choices.
+            A read-only mapping of field names to their available choices.
+        """
+        cls = type(self)
+        cached = cls.__dict__.get("_choice_fields_cache")
+        if cached is not None and cached[0] is self.choice_fields:
+            return cached[1]
+
+        choices = self._build_choice_fields()
+        cls._choice_fields_cache = (self.choice_fields, choices)
+        return choices
+
+    def get_choice_fields_etag(self) -> str:
+        """
+        Returns a quoted ETag for the choice fields, computed once per view class.
+        """
+        cls = type(self)
+        cached = cls.__dict__.get("_choice_fields_etag")
+        if cached is not None and cached[0] is self.choice_fields:
+            return cached[1]
+
+        choices = {field: dict(values) for field, values in self.get_choice_fields().items()}
+        content = json.dumps(choices, sort_keys=True, default=str)
+        etag = quote_etag(hashlib.md5(content.encode()).hexdigest())
+        cls._choice_fields_etag = (self.choice_fields, etag)
+        return etag
+
+    def _build_choice_fields(self) -> Mapping[str, Mapping[str, str]]:
+        """
+        Builds the read-only choice field mapping from the model.
         """
         if not self.choice_fields:
             logger.info("No `choice_fields` defined on the viewset.")
@@ -59,74 +124,96 @@ class ModelChoiceFieldActionMixin:
                 "`choice_fields` must be defined in your ViewSet when using ChoiceFieldViewSetMixin."
             )
 
+        choice_fields = self.choice_fields
         model = self.get_model()
-        choices_as_dict: dict[str, dict[str, str]] = {}
+        get_field = model._meta.get_field
+        # Choice fields are concrete forward fields, so try Django's prebuilt
+        # name -> field map first and fall back to get_field() for the rest.
+        forward_fields = getattr(model._meta, "_forward_fields_map", None) or {}
+        choices_as_dict: dict[str, Mapping[str, str]] = {}
 
-        for field_name in self.choice_fields:
+        for field_name in choice_fields:
             try:
-                field = model._meta.get_field(field_name)
-                raw_choices = cast(Iterable[Tuple[str, str]], field.choices or [])
+                field = forward_fields.get(field_name) or get_field(field_name)
+                raw_choices = field.choices or []
 
                 if not all(
                     isinstance(choice, (list, tuple)) and len(choice) == 2
                     for choice in raw_choices
                 ):
                     logger.warning(
-                        f"Invalid choice format on field '{field_name}'. Expected 2-tuples."
+                        "Invalid choice format on field '%s'. Expected 2-tuples.",
+                        field_name,
                     )
                     continue  # Skip invalid choices
 
                 if not raw_choices:
-                    logger.warning(f"Field '{field_name}' has no choices.")
+                    logger.warning("Field '%s' has no choices.", field_name)
                     continue
-                choices_as_dict[field_name] = dict(raw_choices)
+                choices_as_dict[field_name] = MappingProxyType(
+                    {value: label for value, label in raw_choices}
+                )
                 logger.debug(
-                    f"Loaded choices for field '{field_name}': {choices_as_dict[field_name]}"
+                    "Loaded choices for field '%s': %s",
+                    field_name,
+                    choices_as_dict[field_name],
                 )
             except FieldDoesNotExist:
                 logger.error(
-                    f"Field '{field_name}' does not exist on model '{model.__name__}'."
+                    "Field '%s' does not exist on model '%s'.",
+                    field_name,
+                    model.__name__,
                 )
                 raise ChoiceFieldNotFound(
                     f"Field '{field_name}' does not exist on model '{model.__name__}'."
                 )
 
-        return choices_as_dict
+        return MappingProxyType(choices_as_dict)
 
     @action(detail=False, methods=["get"], url_path="choice-fields")
     def choice_fields_action(self, request: Request) -> Response:
         """
         DRF action that returns the configured choice fields in the model.
         Accessible via GET /<viewset-url>/choice-fields/
+        Supports conditional requests: a matching If-None-Match gets a 304.
         """
         try:
             choices = self.get_choice_fields()
 
+            # Choices only change on deploy, so let clients revalidate cheaply
+            etag = self.get_choice_fields_etag()
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                not_modified["ETag"] = etag
+                return not_modified  # type: ignore[return-value]
+
             if not choices:
                 logger.info("No choice fields returned.")
                 return success_response(
-                    message="No choice fields found.",
-                    data={"detail": "No choice fields found."},
+                    message=_NO_FIELDS_MESSAGE,
+                    data=_NO_FIELDS_DATA,
                 )
 
             logger.info("Choice fields retrieved successfully.")
-            return success_response(
+            response = success_response(
                 message="Choice fields retrieved successfully.",
-                data=choices,
+                data=choices,  # type: ignore[arg-type]
             )
+            response["ETag"] = etag
+            return response
 
         except ChoiceFieldNotFound as e:
-            logger.warning(f"Choice field retrieval failed: {e}")
+            logger.warning("Choice field retrieval failed: %s", e)
             return failure_response(
                 message="Choice retrieval failed.",
-                errors={"detail": "Failed to retrieve choice fields."},
+                errors=_CHOICE_FAILURE_ERRORS,
             )
 
         except Exception as e:
             logger.exception(
-                f"Unexpected error during choice field retrieval. \nErrror: {e}"
+                "Unexpected error during choice field retrieval. \nErrror: %s", e
             )
             return failure_response(
                 message="Something went wrong. Please try again later.",
-                errors={"detail": "An unexpected error occurred."},
+                errors=_UNEXPECTED_ERRORS,
             )
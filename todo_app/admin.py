@@ -1,42 +1,49 @@
+from typing import Any
+
 from django.contrib import admin
+from django.db.models import Model
 
 from .models import SubTask, Tag, Todo
 
 
-@admin.register(Tag)
-class TagAdmin(admin.ModelAdmin):
-    list_display = [
-        field.name
-        for field in Tag._meta.get_fields()
-        if not (field.many_to_many or field.one_to_many)
-    ]
-    list_display_links = list_display
-    ordering = ("-id",)
-    list_filter = []
-    search_fields = ["title"]
-
-
-@admin.register(Todo)
-class TodoAdmin(admin.ModelAdmin):
-    list_display = [
-        field.name
-        for field in Todo._meta.get_fields()
-        if not (field.many_to_many or field.one_to_many)
-    ]
-    list_display_links = list_display
-    ordering = ("-id",)
-    list_filter = ["completed_at", "priority", "status", "tags", "is_deleted"]
-    search_fields = ["owner", "title", "description"]
-
-
-@admin.register(SubTask)
-class SubTaskAdmin(admin.ModelAdmin):
-    list_display = [
-        field.name
-        for field in SubTask._meta.get_fields()
-        if not (field.many_to_many or field.one_to_many)
-    ]
-    list_display_links = list_display
-    ordering = ("-id",)
-    list_filter = ["todo", "is_done"]
-    search_fields = ["title"]
+def make_admin(model: type[Model], **overrides: Any) -> type[admin.ModelAdmin]:
+    """
+    Builds a ModelAdmin for `model` listing and linking every concrete
+    field, newest first. Keyword arguments override or extend the options.
+    """
+    columns = tuple(field.name for field in model._meta.concrete_fields)
+    options = {
+        "list_display": columns,
+        "list_display_links": columns,
+        "ordering": ("-id",),
+        **overrides,
+    }
+    return type(f"{model.__name__}Admin", (admin.ModelAdmin,), options)
+
+
+admin.site.register(
+    Tag,
+    make_admin(Tag, search_fields=["title"]),
+)
+
+admin.site.register(
+    Todo,
+    make_admin(
+        Todo,
+        list_filter=["completed_at", "priority", "status", "tags", "is_deleted"],
+        list_select_related=("user",),
+        autocomplete_fields=("user", "tags"),
+        search_fields=["user__username", "title", "description"],
+    ),
+)
+
+admin.site.register(
+    SubTask,
+    make_admin(
+        SubTask,
+        list_filter=["todo", "is_done"],
+        list_select_related=("todo",),
+        autocomplete_fields=("todo",),
+        search_fields=["title"],
+    ),
+)
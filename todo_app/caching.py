@@ -0,0 +1,42 @@
+import hashlib
+from datetime import datetime
+from uuid import uuid4
+
+from django.core.cache import cache
+from rest_framework.request import Request
+
+# Tag list pages are cached for this many seconds
+TAG_LIST_CACHE_TIMEOUT = 60
+
+# Serialized todo details are cached for this many seconds
+TODO_DETAIL_CACHE_TIMEOUT = 300
+
+# Bumping this token orphans every cached entry holding tag data at once
+_TAG_VERSION_KEY = "tags:version"
+
+
+def tag_cache_version() -> str:
+    """Return the current tag data version token."""
+    return cache.get_or_set(_TAG_VERSION_KEY, uuid4().hex, timeout=None)
+
+
+def tag_list_cache_key(request: Request) -> str:
+    """Return the cache key for the tag list page requested by `request`."""
+    # The cached page embeds absolute next/previous links, so key on the
+    # full URL: scheme, host and query string all shape those links
+    url = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+    return f"tags:list:{tag_cache_version()}:{url}"
+
+
+def todo_detail_cache_key(todo_id: int, updated_at: datetime) -> str:
+    """
+    Return the cache key for a serialized todo. Saving the todo moves
+    `updated_at` and changing any tag moves the tag version, so either
+    makes the old entry unreachable.
+    """
+    return f"todo:{todo_id}:{updated_at.timestamp()}:{tag_cache_version()}"
+
+
+def invalidate_tag_caches() -> None:
+    """Drop all cached tag list pages and serialized todos."""
+    cache.set(_TAG_VERSION_KEY, uuid4().hex, timeout=None)
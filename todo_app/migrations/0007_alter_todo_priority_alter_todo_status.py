@@ -0,0 +1,39 @@
+# Generated by Django 5.2 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todo_app", "0006_alter_todo_status_alter_todo_title"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="todo",
+            name="priority",
+            field=models.CharField(
+                choices=[("L", "Low"), ("M", "Medium"), ("H", "High"), ("U", "Urgent")],
+                db_index=True,
+                default="M",
+                error_messages={
+                    "invalid_choice": "Please choose one of the following options: L: Low, M: Medium, H: High, U: Urgent."
+                },
+                max_length=1,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="todo",
+            name="status",
+            field=models.CharField(
+                choices=[("P", "Pending"), ("C", "Completed"), ("A", "Archived")],
+                db_index=True,
+                default="P",
+                error_messages={
+                    "invalid_choice": "Please choose one of the following options: P: Pending, C: Completed, A: Archived."
+                },
+                max_length=1,
+            ),
+        ),
+    ]
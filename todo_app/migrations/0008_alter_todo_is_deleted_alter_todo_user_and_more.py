@@ -0,0 +1,50 @@
+# Generated by Django 5.2 on 2026-10-16 09:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todo_app", "0007_alter_todo_priority_alter_todo_status"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="todo",
+            name="is_deleted",
+            field=models.BooleanField(
+                default=False, error_messages={"invalid": "Invalid value"}
+            ),
+        ),
+        migrations.AlterField(
+            model_name="todo",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                error_messages={
+                    "blank": "This field cannot be blank",
+                    "does_not_exist": "Object does not exist",
+                    "invalid": "Invalid value",
+                    "invalid_choice": "Select a valid choice. That choice is not one of the available choices.",
+                    "null": "This field cannot be null",
+                },
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="todos",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="todo",
+            index=models.Index(fields=["user", "-id"], name="todo_user_id_desc"),
+        ),
+        migrations.AddIndex(
+            model_name="todo",
+            index=models.Index(
+                fields=["is_deleted", "status", "-id"], name="todo_del_status_id"
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-16 10:15
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todo_app", "0008_alter_todo_is_deleted_alter_todo_user_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="tag",
+            name="title",
+            field=models.CharField(
+                error_messages={
+                    "blank": "This field cannot be blank",
+                    "invalid": "Invalid value",
+                    "max_length": "Ensure this value has at most 50 characters",
+                    "null": "This field cannot be null",
+                },
+                max_length=50,
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="tag",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("title"),
+                name="tag_title_ci_unique",
+                violation_error_message="A tag with this title already exists",
+            ),
+        ),
+    ]
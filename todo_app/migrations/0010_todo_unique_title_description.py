@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-16 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todo_app", "0009_alter_tag_title_tag_tag_title_ci_unique"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="todo",
+            constraint=models.UniqueConstraint(
+                fields=("title", "description"), name="unique_title_description"
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2 on 2026-10-16 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todo_app", "0010_todo_unique_title_description"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="todo",
+            name="title",
+            field=models.CharField(
+                error_messages={
+                    "blank": "This field cannot be blank",
+                    "invalid": "Invalid value",
+                    "max_length": "Ensure this value has at most 255 characters",
+                    "null": "This field cannot be null",
+                },
+                max_length=255,
+            ),
+        ),
+    ]
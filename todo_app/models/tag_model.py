@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models.functions import Lower
 
 User = get_user_model()
 
@@ -12,16 +13,24 @@ class Tag(models.Model):
         verbose_name = "tag"
         verbose_name_plural = "tags"
         ordering = ["-id"]
+        constraints = [
+            # Case-insensitive uniqueness; its index serves Lower("title") lookups
+            models.UniqueConstraint(
+                Lower("title"),
+                name="tag_title_ci_unique",
+                violation_error_message="A tag with this title already exists",
+            ),
+        ]
 
     objects = models.Manager()
 
     # Model fields for Tag
     title = models.CharField(
         max_length=50,
-        unique=True,
+        unique=False,
         null=False,
         blank=False,
-        db_index=True,
+        db_index=False,
         error_messages={
             "invalid": "Invalid value",
             "null": "This field cannot be null",
@@ -7,6 +7,11 @@ from .tag_model import Tag
 User = get_user_model()
 
 
+def _format_choices(choices: list[tuple[str, str]]) -> str:
+    """Format choices as "code: label" pairs for validation messages."""
+    return ", ".join(f"{code}: {label}" for code, label in choices)
+
+
 class Todo(models.Model):
     """Model class for Todo"""
 
@@ -21,6 +26,14 @@ class Todo(models.Model):
                 name="unique_title_description",
             )
         ]
+        # Match the list endpoints' filters plus their "-id" ordering, so
+        # pages are read straight off the index without a sort.
+        indexes: list[models.Index] = [
+            models.Index(fields=["user", "-id"], name="todo_user_id_desc"),
+            models.Index(
+                fields=["is_deleted", "status", "-id"], name="todo_del_status_id"
+            ),
+        ]
 
     objects = models.Manager()
 
@@ -48,7 +61,7 @@ class Todo(models.Model):
         parent_link=False,
         blank=False,
         null=False,
-        db_index=True,
+        db_index=False,  # Covered by the "todo_user_id_desc" index
         db_constraint=True,
         error_messages={
             "invalid": "Invalid value",
@@ -63,7 +76,7 @@ class Todo(models.Model):
         unique=False,
         blank=False,
         null=False,
-        db_index=True,
+        db_index=False,  # Covered by the "unique_title_description" index
         error_messages={
             "invalid": "Invalid value",
             "null": "This field cannot be null",
@@ -99,23 +112,23 @@ class Todo(models.Model):
         },
     )
     priority = models.CharField(
-        max_length=255,
+        max_length=1,
         unique=False,
         db_index=True,
         choices=PRIORITY_CHOICES,
         default="M",
         error_messages={
-            "invalid_choice": f"Please choose one of the following options: {', '.join([f'{t[0]}: {t[-1]}' for t in PRIORITY_CHOICES])}.",
+            "invalid_choice": f"Please choose one of the following options: {_format_choices(PRIORITY_CHOICES)}.",
         },
     )
     status = models.CharField(
-        max_length=255,
+        max_length=1,
         unique=False,
         db_index=True,
         choices=STATUS_CHOICES,
         default="P",
         error_messages={
-            "invalid_choice": f"Please choose one of the following options: {', '.join([f'{t[0]}: {t[-1]}' for t in STATUS_CHOICES])}."
+            "invalid_choice": f"Please choose one of the following options: {_format_choices(STATUS_CHOICES)}."
         },
     )
     tags = models.ManyToManyField(
@@ -131,7 +144,7 @@ class Todo(models.Model):
     )
     is_deleted = models.BooleanField(
         default=False,
-        db_index=True,
+        db_index=False,  # Covered by the "todo_del_status_id" index
         error_messages={
             "invalid": "Invalid value",
         },
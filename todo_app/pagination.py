@@ -0,0 +1,39 @@
+from typing import Any
+
+from rest_framework.pagination import CursorPagination
+
+
+class TodoKeysetPagination(CursorPagination):
+    """
+    Keyset (cursor) pagination for todos, newest first.
+
+    Each page is fetched with `WHERE id < :cursor ORDER BY id DESC LIMIT n`,
+    so deep pages cost the same as the first and no COUNT(*) is run.
+
+    Response Structure:
+        {
+            "page": {
+                "size": int,
+                "next": str | None,
+                "previous": str | None,
+            },
+            "results": list
+        }
+    """
+
+    ordering = "-id"
+    page_size = 50
+
+    # Allow clients to set page size via ?page-size=
+    page_size_query_param = "page-size"
+    max_page_size = 200
+
+    def get_paginated_data(self, data: Any) -> dict[str, Any]:
+        return {
+            "page": {
+                "size": self.page_size,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+            },
+            "results": data,
+        }
@@ -1,14 +1,16 @@
 from rest_framework.serializers import ModelSerializer
 
-from rest_core.serializers.mixins import RecordsCreationMixin
+from rest_core.serializers import BulkListSerializer
+from rest_core.serializers.mixins import FieldsCacheMixin, RecordsCreationMixin
 
 from ..models import SubTask
 
 
-class SubTaskSerializer(RecordsCreationMixin, ModelSerializer):
+class SubTaskSerializer(FieldsCacheMixin, RecordsCreationMixin, ModelSerializer):
     """Serializer class for SubTask"""
 
     class Meta:
         model = SubTask
+        list_serializer_class = BulkListSerializer
         fields = ["id", "todo", "title", "is_done", "created_at", "updated_at"]
         read_only_fields = ["id", "created_at", "updated_at"]
@@ -1,14 +1,72 @@
-from rest_framework.serializers import ModelSerializer
+from typing import Any, Mapping
 
-from rest_core.serializers.mixins import RecordsCreationMixin
+from django.db.models.functions import Lower
+from rest_framework.serializers import ModelSerializer, ValidationError
+
+from rest_core.serializers import BulkListSerializer
+from rest_core.serializers.mixins import FieldsCacheMixin, RecordsCreationMixin
 
 from ..models import Tag
 
+TITLE_TAKEN_MESSAGE = "A tag with this title already exists"
+
+
+class TagListSerializer(BulkListSerializer):
+    """
+    BulkListSerializer for tags that enforces case-insensitive unique titles
+    for a whole list with one query, instead of one query per item.
+    Titles are checked against the stored tags outside the payload and
+    against each other.
+    """
+
+    def to_internal_value(self, data: Any) -> Any:
+        if isinstance(data, list):
+            titles = {
+                item["title"].strip().lower()
+                for item in data
+                if isinstance(item, Mapping) and isinstance(item.get("title"), str)
+            }
+            # Fetch every stored title that could clash with the list at once
+            queryset = Tag.objects.annotate(lower_title=Lower("title")).filter(
+                lower_title__in=titles
+            )
+            if isinstance(self.instance, list):
+                queryset = queryset.exclude(pk__in=[obj.pk for obj in self.instance])
+            self._taken_titles = set(queryset.values_list("lower_title", flat=True))
+        return super().to_internal_value(data)
 
-class TagSerializer(RecordsCreationMixin, ModelSerializer):
+    def run_child_validation(self, data: Any) -> Any:
+        attrs = super().run_child_validation(data)
+        taken = self.__dict__.get("_taken_titles")
+        title = attrs.get("title")
+        if taken is not None and title is not None:
+            if title.lower() in taken:
+                raise ValidationError({"title": [TITLE_TAKEN_MESSAGE]}, code="unique")
+            # Also reject duplicates within the submitted list
+            taken.add(title.lower())
+        return attrs
+
+
+class TagSerializer(FieldsCacheMixin, RecordsCreationMixin, ModelSerializer):
     """Serializer class for Tag"""
 
     class Meta:
         model = Tag
+        list_serializer_class = TagListSerializer
         fields = ["id", "title", "color"]
         read_only_fields = ["id"]
+
+    def validate_title(self, value: str) -> str:
+        """Reject titles that match an existing tag case-insensitively."""
+        # Lists are checked in one query by TagListSerializer
+        if isinstance(self.parent, TagListSerializer):
+            return value
+
+        queryset = Tag.objects.annotate(lower_title=Lower("title")).filter(
+            lower_title=value.lower()
+        )
+        if self.instance is not None:
+            queryset = queryset.exclude(pk=self.instance.pk)
+        if queryset.exists():
+            raise ValidationError(TITLE_TAKEN_MESSAGE)
+        return value
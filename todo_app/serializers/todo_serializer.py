@@ -1,23 +1,104 @@
-from rest_framework.serializers import ModelSerializer
+from functools import cached_property
+from typing import Any, Callable, Mapping
 
-from rest_core.serializers.mixins import RecordsCreationMixin
+from django.db.models import Prefetch, QuerySet
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+from rest_framework.serializers import (
+    ModelSerializer,
+    SerializerMethodField,
+    ValidationError,
+)
+from rest_framework.validators import UniqueTogetherValidator
 
-from ..models import Todo
+from rest_core.serializers import BulkListSerializer
+from rest_core.serializers.mixins import FieldsCacheMixin, RecordsCreationMixin
+
+from ..models import Tag, Todo
 from .tag_serializer import TagSerializer
 from .user_serializer import UserSerializer
 
 
-class TodoSerializer(RecordsCreationMixin, ModelSerializer):
+class TodoListSerializer(BulkListSerializer):
+    """
+    BulkListSerializer for todos that checks the unique (title, description)
+    pair for a whole list with one query, instead of one query per item.
+    Pairs are checked against the stored rows outside the payload and
+    against each other, for both bulk create and bulk update.
+    """
+
+    def to_internal_value(self, data: Any) -> Any:
+        if isinstance(data, list):
+            # Titles each item ends up with; updates keep their stored title
+            titles = set()
+            for item in data:
+                title = item.get("title") if isinstance(item, Mapping) else None
+                if isinstance(title, str):
+                    titles.add(title.strip())
+                instance = self.get_item_instance(item)
+                if instance is not None:
+                    titles.add(instance.title)
+
+            # Fetch every stored pair that could clash with the list in one
+            # query; rows being updated are re-checked with their new values
+            queryset = Todo.objects.filter(title__in=titles)
+            if isinstance(self.instance, list):
+                queryset = queryset.exclude(pk__in=[obj.pk for obj in self.instance])
+            self._taken_pairs = set(queryset.values_list("title", "description"))
+
+            # The batch check replaces the per-item unique validator
+            self.child.validators = [
+                validator
+                for validator in self.child.validators
+                if not isinstance(validator, UniqueTogetherValidator)
+            ]
+        return super().to_internal_value(data)
+
+    def run_child_validation(self, data: Any) -> Any:
+        attrs = super().run_child_validation(data)
+        taken = self.__dict__.get("_taken_pairs")
+        if taken is not None:
+            # Fields left out of an update keep the instance's stored value
+            instance = self.get_item_instance(data)
+            if instance is not None:
+                default_title = instance.title
+                default_description = instance.description
+            else:
+                default_title = None
+                default_description = Todo._meta.get_field("description").default
+            pair = (
+                attrs.get("title", default_title),
+                attrs.get("description", default_description),
+            )
+            # Like the database constraint, NULLs never clash
+            if None not in pair:
+                if pair in taken:
+                    message = UniqueTogetherValidator.message.format(
+                        field_names="title, description"
+                    )
+                    raise ValidationError(
+                        {"non_field_errors": [message]}, code="unique"
+                    )
+                # Also reject duplicates within the submitted list
+                taken.add(pair)
+        return attrs
+
+
+class TodoSerializer(FieldsCacheMixin, RecordsCreationMixin, ModelSerializer):
     """Serializer class for Todo"""
 
-    # Serializer to many-to-many relationship with tags
-    tags = TagSerializer(many=True, required=False)
+    # Read-only many-to-many tags, served from the prefetched list when present
+    tags = SerializerMethodField()
 
     # Serializer to ForeginForeignKey relationship with user
     user = UserSerializer(read_only=True)
 
+    # Keep each bulk INSERT/UPDATE well under the database's statement size limits
+    bulk_batch_size = 1000
+
     class Meta:
         model = Todo
+        list_serializer_class = TodoListSerializer
         fields = [
             "id",
             "user",
@@ -33,3 +114,75 @@ class TodoSerializer(RecordsCreationMixin, ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ["id", "user", "created_at", "updated_at"]
+
+    @classmethod
+    def setup_eager_loading(cls, queryset: QuerySet[Todo]) -> QuerySet[Todo]:
+        """
+        Load the nested user and tags up front to avoid per-todo queries,
+        selecting only the user columns UserSerializer renders.
+        """
+        columns = [
+            name for name in cls.Meta.fields if Todo._meta.get_field(name).concrete
+        ]
+        columns += [f"user__{name}" for name in UserSerializer.Meta.fields]
+        return (
+            queryset.select_related("user")
+            .only(*columns)
+            .prefetch_related(
+                Prefetch(
+                    "tags",
+                    queryset=Tag.objects.only("id", "title", "color"),
+                    to_attr="_prefetched_tags",
+                )
+            )
+        )
+
+    def create(self, validated_data):
+        instances = super().create(validated_data)
+        # New todos have no tags yet, so skip the per-todo tags query
+        for todo in instances if isinstance(instances, list) else [instances]:
+            todo._prefetched_tags = []
+        return instances
+
+    @cached_property
+    def _representation_plan(
+        self,
+    ) -> tuple[tuple[str, Callable[[Any], Any], Callable[[Any], Any]], ...]:
+        """(name, get_attribute, to_representation) for each readable field."""
+        return tuple(
+            (field.field_name, field.get_attribute, field.to_representation)
+            for field in self._readable_fields
+        )
+
+    def to_representation(self, instance: Todo) -> dict[str, Any]:
+        """
+        Same output as ModelSerializer.to_representation, but walks a field
+        plan resolved once per serializer instead of re-reading the fields
+        and their bound methods for every todo.
+        """
+        ret: dict[str, Any] = {}
+        for name, get_attribute, to_representation in self._representation_plan:
+            try:
+                attribute = get_attribute(instance)
+            except SkipField:
+                continue
+
+            # Match DRF: PK-only relations are checked for None on their pk
+            check_for_none = (
+                attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            )
+            ret[name] = None if check_for_none is None else to_representation(attribute)
+        return ret
+
+    @cached_property
+    def _tag_serializer(self) -> TagSerializer:
+        """One TagSerializer reused for the tags of every todo rendered."""
+        return TagSerializer(context=self.context)
+
+    def get_tags(self, obj: Todo) -> list:
+        """Serialize tags from the eager-loaded list, falling back to the manager."""
+        tags = getattr(obj, "_prefetched_tags", None)
+        if tags is None:
+            tags = obj.tags.all()
+        to_representation = self._tag_serializer.to_representation
+        return [to_representation(tag) for tag in tags]
@@ -0,0 +1,15 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .caching import invalidate_tag_caches
+from .models import Tag, Todo
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(m2m_changed, sender=Todo.tags.through)
+def on_tag_change(sender, **kwargs) -> None:
+    """Invalidate cached tag data when a tag or a todo's tags change."""
+    # Wait for the commit so a concurrent read cannot re-cache stale rows
+    transaction.on_commit(invalidate_tag_caches)
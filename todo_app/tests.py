@@ -1,3 +1,247 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from rest_core.views.mixins import ModelObjectMixin, QuerysetAttributeNotFound
+
+from .models import Tag, Todo
+from .serializers import TagSerializer, TodoSerializer
+from .throttling import TodoBlacklistThrottle
+
+
+class TodoBulkUpdateTests(APITestCase):
+    """Tests for bulk PUT on the todo list endpoint."""
+
+    url = "/api/v1/todos/"
+
+    def setUp(self) -> None:
+        # Throttle history lives in the cache; start each test clean
+        cache.clear()
+        user = get_user_model().objects.create_user(username="owner")
+        self.first = Todo.objects.create(user=user, title="first", description="a")
+        self.second = Todo.objects.create(user=user, title="second", description="b")
+        self.other = Todo.objects.create(user=user, title="other", description="c")
+
+    def test_updates_every_item(self) -> None:
+        response = self.client.put(
+            self.url,
+            [
+                {"id": self.first.id, "title": "first v2", "description": "a"},
+                {"id": self.second.id, "title": "second v2", "description": "b"},
+            ],
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.first.refresh_from_db()
+        self.second.refresh_from_db()
+        self.assertEqual(self.first.title, "first v2")
+        self.assertEqual(self.second.title, "second v2")
+
+    def test_rejects_duplicate_pairs_within_payload(self) -> None:
+        response = self.client.put(
+            self.url,
+            [
+                {"id": self.first.id, "title": "same", "description": "x"},
+                {"id": self.second.id, "title": "same", "description": "x"},
+            ],
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.title, "first")
+
+    def test_rejects_pair_held_by_row_outside_payload(self) -> None:
+        response = self.client.put(
+            self.url,
+            [{"id": self.first.id, "title": "other", "description": "c"}],
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_rejects_invalid_ids(self) -> None:
+        for payload in (
+            [{"id": "abc", "title": "x"}],
+            [{"id": [1], "title": "x"}],
+            ["not an object"],
+            [
+                {"id": self.first.id, "title": "x"},
+                {"id": self.first.id, "title": "y"},
+            ],
+        ):
+            with self.subTest(payload=payload):
+                response = self.client.put(self.url, payload, format="json")
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_unknown_id_is_not_found(self) -> None:
+        response = self.client.put(
+            self.url, [{"id": 999999, "title": "x"}], format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TagBulkCreateTests(APITestCase):
+    """Tests for bulk POST on the tag list endpoint."""
+
+    url = "/api/v1/tags/"
+
+    def setUp(self) -> None:
+        # Throttle history and cached tag pages live in the cache
+        cache.clear()
+        Tag.objects.create(title="Work")
+
+    def test_creates_every_item(self) -> None:
+        response = self.client.post(
+            self.url, [{"title": "Home"}, {"title": "Errands"}], format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Tag.objects.count(), 3)
+
+    def test_rejects_case_insensitive_duplicates_within_payload(self) -> None:
+        response = self.client.post(
+            self.url, [{"title": "Home2"}, {"title": "home2"}], format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Tag.objects.count(), 1)
+
+    def test_rejects_title_matching_stored_tag(self) -> None:
+        response = self.client.post(
+            self.url, [{"title": "Home"}, {"title": "WORK"}], format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Tag.objects.count(), 1)
+
+
+@override_settings(ALLOWED_HOSTS=["testserver", "other.example"])
+class TagListCacheTests(APITestCase):
+    """Tests for the cached tag list pages."""
+
+    url = "/api/v1/tags/"
+
+    def setUp(self) -> None:
+        cache.clear()
+        Tag.objects.create(title="Work")
+        Tag.objects.create(title="Home")
+
+    def test_page_links_follow_each_request_host_and_query(self) -> None:
+        self.client.get(self.url, {"page-size": 1, "search": "secret"})
+
+        response = self.client.get(
+            self.url, {"page-size": 1}, HTTP_HOST="other.example", secure=True
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        next_link = response.json()["data"]["page"]["next"]
+        self.assertTrue(next_link.startswith("https://other.example/api/v1/tags/"))
+        self.assertNotIn("secret", next_link)
+
+
+class FieldsCacheMixinTests(APITestCase):
+    """Tests for per-class serializer field caching."""
+
+    def test_fields_are_built_once_and_copied_per_instance(self) -> None:
+        first = TagSerializer()
+        second = TagSerializer()
+
+        self.assertEqual(list(first.fields), ["id", "title", "color"])
+        self.assertIn("_cached_fields", TagSerializer.__dict__)
+        for name in first.fields:
+            self.assertIsNot(first.fields[name], second.fields[name])
+
+    def test_nested_serializers_bind_to_their_own_parent(self) -> None:
+        first = TodoSerializer(context={"marker": 1})
+        second = TodoSerializer(context={"marker": 2})
+
+        self.assertIs(first.fields["user"].parent, first)
+        self.assertIs(second.fields["user"].parent, second)
+        self.assertEqual(second.fields["user"].context, {"marker": 2})
+
+
+class TodoBlacklistThrottleTests(APITestCase):
+    """Tests for blacklisting clients that exceed their rate."""
+
+    class TwoPerMinuteThrottle(TodoBlacklistThrottle):
+        rate = "2/minute"
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.request = APIRequestFactory().get("/")
+        self.request.user = AnonymousUser()
+
+    def allow(self) -> tuple[bool, TodoBlacklistThrottle]:
+        throttle = self.TwoPerMinuteThrottle()
+        return throttle.allow_request(self.request, None), throttle
+
+    def test_blacklists_client_once_over_the_rate(self) -> None:
+        self.assertTrue(self.allow()[0])
+        self.assertTrue(self.allow()[0])
+
+        allowed, throttle = self.allow()
+        self.assertFalse(allowed)
+        key = throttle.get_cache_key(self.request, None)
+        self.assertIsNotNone(cache.get(throttle.get_blacklist_key(key)))
+        self.assertGreater(throttle.wait(), 0)
+
+    def test_blacklisted_client_is_rejected_without_touching_history(self) -> None:
+        for _ in range(3):
+            self.allow()
+        throttle = self.TwoPerMinuteThrottle()
+        key = throttle.get_cache_key(self.request, None)
+        history = cache.get(key)
+
+        allowed, throttle = self.allow()
+
+        self.assertFalse(allowed)
+        self.assertEqual(cache.get(key), history)
+        self.assertGreater(throttle.wait(), 0)
+
+    def test_reads_blacklist_and_history_in_one_cache_call(self) -> None:
+        throttle = self.TwoPerMinuteThrottle()
+
+        with mock.patch.object(
+            throttle.cache, "get_many", wraps=throttle.cache.get_many
+        ) as get_many, mock.patch.object(throttle.cache, "get") as get:
+            self.assertTrue(throttle.allow_request(self.request, None))
+
+        get_many.assert_called_once()
+        get.assert_not_called()
+
+
+class GetObjectValuesTests(APITestCase):
+    """Tests for ModelObjectMixin.get_object_values."""
+
+    class TodoValues(ModelObjectMixin[Todo]):
+        queryset = Todo.objects.all()
+
+    def setUp(self) -> None:
+        user = get_user_model().objects.create_user(username="owner")
+        self.todo = Todo.objects.create(user=user, title="first", description="a")
+
+    def test_returns_selected_fields_as_dict(self) -> None:
+        values = self.TodoValues().get_object_values(("id", "title"), id=self.todo.id)
+
+        self.assertEqual(values, {"id": self.todo.id, "title": "first"})
+
+    def test_returns_all_concrete_fields_when_none_selected(self) -> None:
+        values = self.TodoValues().get_object_values(id=self.todo.id)
+
+        self.assertIsNotNone(values)
+        self.assertEqual(values["user_id"], self.todo.user_id)
+
+    def test_returns_none_when_no_row_matches(self) -> None:
+        self.assertIsNone(self.TodoValues().get_object_values(id=self.todo.id + 1))
+
+    def test_requires_queryset(self) -> None:
+        with self.assertRaises(QuerysetAttributeNotFound):
+            ModelObjectMixin().get_object_values(id=1)
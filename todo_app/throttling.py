@@ -0,0 +1,53 @@
+from rest_framework.throttling import UserRateThrottle
+
+
+class TodoBlacklistThrottle(UserRateThrottle):
+    """
+    UserRateThrottle that blacklists a client once it exceeds its rate.
+
+    Each request costs one cache read for both the blacklist entry and the
+    history. While blacklisted, requests are rejected without trimming or
+    rewriting the history.
+    The blacklist entry expires when the client's rate window frees up.
+    """
+
+    def get_blacklist_key(self, key: str) -> str:
+        return f"{key}_blacklisted"
+
+    def allow_request(self, request, view) -> bool:
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        # Read the blacklist entry and the history in one cache round trip
+        blacklist_key = self.get_blacklist_key(self.key)
+        cached = self.cache.get_many([self.key, blacklist_key])
+        self.now = self.timer()
+
+        # Already throttled: reject without touching the history
+        self.blocked_until = cached.get(blacklist_key)
+        if self.blocked_until is not None:
+            return False
+
+        # Same sliding window as SimpleRateThrottle.allow_request, run on
+        # the history fetched above instead of reading it again
+        self.history = cached.get(self.key, [])
+        while self.history and self.history[-1] <= self.now - self.duration:
+            self.history.pop()
+        if len(self.history) < self.num_requests:
+            return self.throttle_success()
+
+        # Ban the client until its oldest request leaves the window
+        wait = self.wait() or 0
+        self.blocked_until = self.now + wait
+        self.cache.set(blacklist_key, self.blocked_until, max(1, int(wait)))
+        return self.throttle_failure()
+
+    def wait(self) -> float | None:
+        blocked_until = getattr(self, "blocked_until", None)
+        if blocked_until is not None:
+            return max(0.0, blocked_until - self.now)
+        return super().wait()
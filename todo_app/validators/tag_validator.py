@@ -1,4 +1,24 @@
+from typing import TYPE_CHECKING
+
+from django.apps import apps
 from django.core.exceptions import ValidationError
+from django.db.models.functions import Lower
+
+if TYPE_CHECKING:
+    from ..models import Tag
+
+# Tag model resolved once on first use (models import this module)
+_Tag: "type[Tag] | None" = None
+
+
+def _tag_model() -> "type[Tag]":
+    """
+    Returns the Tag model, resolving it from the app registry on first call.
+    """
+    global _Tag
+    if _Tag is None:
+        _Tag = apps.get_model("todo_app", "Tag")
+    return _Tag
 
 
 class TagValidators:
@@ -11,9 +31,14 @@ class TagValidators:
         """
         Validates whether a tag with the given title exists.
         """
-        # Lazy import of the Tag model
-        from ..models import Tag
+        Tag = _tag_model()
 
-        # Check if the tag exists
-        if not Tag.objects.filter(title=tag).exists():
+        # Check if the tag exists; matching on LOWER(title) uses the
+        # tag_title_ci_unique index, unlike iexact's UPPER() on PostgreSQL
+        exists = (
+            Tag.objects.annotate(lower_title=Lower("title"))
+            .filter(lower_title=tag.lower())
+            .exists()
+        )
+        if not exists:
             raise ValidationError(f"Invalid tag: '{tag}' does not exist.")
@@ -1,3 +1,5 @@
+from django.core.cache import cache
+from django.db import transaction
 from rest_framework.response import Response
 from rest_framework.throttling import UserRateThrottle
 from rest_framework.views import APIView
@@ -5,6 +7,11 @@ from rest_framework.views import APIView
 from rest_core.pagination import paginate_and_serialize_data
 from rest_core.response import destroy_response, failure_response, success_response
 
+from ..caching import (
+    TAG_LIST_CACHE_TIMEOUT,
+    invalidate_tag_caches,
+    tag_list_cache_key,
+)
 from ..models import Tag
 from ..serializers import TagSerializer
 
@@ -18,11 +25,17 @@ class TagListAPIView(APIView):
     def get(self, request) -> Response:
         """Handle GET request and return list of tag."""
 
-        # Query all tags from db.
-        queryset = Tag.objects.all()
+        def paginate_tags():
+            # Query all tags from db, fetching only the serialized columns.
+            queryset = Tag.objects.only(*TagSerializer.Meta.fields)
 
-        # Paginate and serializer featched queryset.
-        paginated_data = paginate_and_serialize_data(request, queryset, TagSerializer)
+            # Paginate and serializer featched queryset.
+            return paginate_and_serialize_data(request, queryset, TagSerializer)
+
+        # Serve the page from cache, computing it on a miss.
+        paginated_data = cache.get_or_set(
+            tag_list_cache_key(request), paginate_tags, TAG_LIST_CACHE_TIMEOUT
+        )
 
         # Return success respone with paginated data.
         return success_response(
@@ -40,7 +53,11 @@ class TagListAPIView(APIView):
 
         # Check serializer is valid or not
         if serializer.is_valid():
-            serializer.save()
+            # Commit all created tags in a single transaction.
+            with transaction.atomic():
+                serializer.save()
+                # Bulk creation skips post_save, so invalidate explicitly.
+                transaction.on_commit(invalidate_tag_caches)
             return success_response(
                 message="Tag created successfully",
                 data=serializer.data,
@@ -57,19 +74,17 @@ class TagDetailAPIView(APIView):
     # Set throttle for this view.
     throttle_classes = [UserRateThrottle]
 
-    def get_object(self, tag_id: int) -> Tag | None:
-        """Get tag object by id."""
+    def get_object(self, tag_id: int, *fields: str) -> Tag | None:
+        """Get tag object by id, optionally loading only the given fields."""
 
-        try:
-            return Tag.objects.get(id=tag_id)
-        except Tag.DoesNotExist:
-            return None
+        queryset = Tag.objects.only(*fields) if fields else Tag.objects.all()
+        return queryset.filter(id=tag_id).first()
 
     def get(self, request, tag_id: int) -> Response:
         """Handle GET request for tag detail."""
 
-        # Get tag object by id.
-        tag = self.get_object(tag_id)
+        # Get tag object by id with only the serialized columns.
+        tag = self.get_object(tag_id, *TagSerializer.Meta.fields)
         if not tag:
             return failure_response(
                 message="Tag not found",
@@ -1,44 +1,47 @@
 from rest_framework import status
 from rest_framework.response import Response
-from rest_framework.throttling import UserRateThrottle
 from rest_framework.views import APIView
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
 
-from rest_core.pagination import paginate_and_serialize_data
 from rest_core.response import failure_response, success_response
 from rest_core.views import ModelChoiceFieldAPIView
-from rest_core.views.mixins import ModelChoiceFieldMixin
 
+from ..caching import TODO_DETAIL_CACHE_TIMEOUT, todo_detail_cache_key
 from ..models import Todo
+from ..pagination import TodoKeysetPagination
 from ..serializers import TodoSerializer
+from ..throttling import TodoBlacklistThrottle
+
+# Shared read-only serializer; to_representation keeps no per-call state,
+# so reusing it skips building the serializer fields on every GET.
+_TODO_READ_SERIALIZER = TodoSerializer()
 
 
 class TodoModelChoiceAPIView(ModelChoiceFieldAPIView):
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [TodoBlacklistThrottle]
     model = Todo
     choice_fields = ["priority", "status"]
 
-    # def get(self, request) -> Response:
-    #     return success_response(
-    #         message="Todo choice fields retrieved successfully",
-    #         data=self.get_choice_fields(),
-    #     )
-
 
 class TodoListAPIView(APIView):
-    """Todo list view to handle GET and POST requests."""
+    """Todo list view to handle GET, POST and bulk PUT requests."""
 
     # Set throttle for this view.
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [TodoBlacklistThrottle]
 
     def get(self, request) -> Response:
         """Handle GET request and return list of todo."""
 
-        # Query all todos from db.
-        queryset = Todo.objects.all()
+        # Query all todos from db along with their user and tags.
+        queryset = TodoSerializer.setup_eager_loading(Todo.objects.all())
 
-        # Paginate and serializer featched queryset.
-        paginated_data = paginate_and_serialize_data(request, queryset, TodoSerializer)
+        # Paginate by cursor on id, so deep pages do not scan skipped rows.
+        paginator = TodoKeysetPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        results = [_TODO_READ_SERIALIZER.to_representation(todo) for todo in page]
+        paginated_data = paginator.get_paginated_data(results)
 
         # Return success respone with paginated data.
         return success_response(
@@ -60,7 +63,9 @@ class TodoListAPIView(APIView):
 
         # Check serializer is valid or not
         if serializer.is_valid():
-            serializer.save(user=user)
+            # Commit all created todos in a single transaction.
+            with transaction.atomic():
+                serializer.save(user=user)
             return success_response(
                 message="Todo created successfully",
                 data=serializer.data,
@@ -70,38 +75,125 @@ class TodoListAPIView(APIView):
             errors=serializer.errors,
         )
 
+    @transaction.atomic
+    def put(self, request) -> Response:
+        """Handle PUT request for bulk todo update."""
+
+        if not isinstance(request.data, list):
+            return failure_response(
+                message="Todo update failed",
+                errors={"todo": ["Expected a list of todos."]},
+            )
+
+        # Every item must be an object carrying a distinct integer id.
+        ids: list[int] = []
+        id_errors: list[str] = []
+        for index, item in enumerate(request.data):
+            todo_id = item.get("id") if isinstance(item, dict) else None
+            if not isinstance(item, dict):
+                id_errors.append(f"Item {index}: expected an object.")
+            elif isinstance(todo_id, bool) or not isinstance(todo_id, int):
+                id_errors.append(f"Item {index}: 'id' must be an integer.")
+            elif todo_id in ids:
+                id_errors.append(f"Item {index}: duplicate id {todo_id}.")
+            else:
+                ids.append(todo_id)
+        if id_errors:
+            return failure_response(
+                message="Todo update failed",
+                errors={"id": id_errors},
+            )
+
+        # Fetch and lock every target todo in one query, with its user and tags.
+        queryset = TodoSerializer.setup_eager_loading(Todo.objects.all())
+        todos = queryset.select_for_update(of=("self",)).in_bulk(ids)
+        missing = [todo_id for todo_id in ids if todo_id not in todos]
+        if missing:
+            return failure_response(
+                message="Todo not found",
+                errors={
+                    "todo": [
+                        f"Todo with id {todo_id} does not exist" for todo_id in missing
+                    ]
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        # Serializer request data against the matching todos, in request order.
+        serializer = TodoSerializer(
+            instance=[todos[todo_id] for todo_id in ids],
+            data=request.data,
+            many=True,
+        )
+
+        # Check serializer is valid or not
+        if serializer.is_valid():
+            # Write all todos with a single bulk UPDATE.
+            serializer.save()
+            return success_response(
+                message="Todo updated successfully",
+                data=serializer.data,
+            )
+        return failure_response(
+            message="Todo update failed",
+            errors=serializer.errors,
+        )
+
 
 class TodoDetailAPIView(APIView):
     """Todo detail view to handle GET, PUT and DELETE requests."""
 
     # Set throttle for this view.
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [TodoBlacklistThrottle]
 
-    def get_object(self, todo_id: int) -> Todo | None:
-        """Get todo object by id."""
-        try:
-            return Todo.objects.get(id=todo_id)
-        except Todo.DoesNotExist:
-            return None
+    def get_object(self, todo_id: int, for_update: bool = False) -> Todo | None:
+        """
+        Get todo object by id along with the user and tags it serializes.
+        With `for_update`, the todo row (not its user) is locked until the
+        surrounding transaction ends.
+        """
+        queryset = TodoSerializer.setup_eager_loading(Todo.objects.all())
+        if for_update:
+            queryset = queryset.select_for_update(of=("self",))
+        return queryset.filter(id=todo_id).first()
 
     def get(self, request, todo_id: int) -> Response:
         """Handle GET request for todo detail."""
-        todo = self.get_object(todo_id)
-        if todo:
-            serializer = TodoSerializer(todo)
-            return success_response(
-                message="Todo retrive request wass successfull",
-                data=serializer.data,
+        # Read just the row version to find the cached serialized todo.
+        updated_at = (
+            Todo.objects.filter(id=todo_id)
+            .values_list("updated_at", flat=True)
+            .first()
+        )
+        if updated_at is None:
+            return failure_response(
+                message="Todo not found",
+                errors={"todo": ["Todo with this id does not exist"]},
+                status=status.HTTP_404_NOT_FOUND,
             )
-        return failure_response(
-            message="Todo not found",
-            errors={"todo": ["Todo with this id does not exist"]},
-            status=status.HTTP_404_NOT_FOUND,
+
+        cache_key = todo_detail_cache_key(todo_id, updated_at)
+        data = cache.get(cache_key)
+        if data is None:
+            todo = self.get_object(todo_id)
+            if not todo:
+                return failure_response(
+                    message="Todo not found",
+                    errors={"todo": ["Todo with this id does not exist"]},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            data = _TODO_READ_SERIALIZER.to_representation(todo)
+            cache.set(cache_key, data, TODO_DETAIL_CACHE_TIMEOUT)
+
+        return success_response(
+            message="Todo retrive request wass successfull",
+            data=data,
         )
 
+    @transaction.atomic
     def put(self, request, todo_id: int) -> Response:
         """Handle PUT request for todo update."""
-        todo = self.get_object(todo_id)
+        todo = self.get_object(todo_id, for_update=True)
         if not todo:
             return failure_response(
                 message="Todo not found",
@@ -124,9 +216,10 @@ class TodoDetailAPIView(APIView):
             errors=serializer.errors,
         )
 
+    @transaction.atomic
     def patch(self, request, todo_id: int) -> Response:
         """Handle PATCH request for partial todo update."""
-        todo = self.get_object(todo_id)
+        todo = self.get_object(todo_id, for_update=True)
         if not todo:
             return failure_response(
                 message="Todo not found",
@@ -151,16 +244,15 @@ class TodoDetailAPIView(APIView):
 
     def delete(self, request, todo_id: int) -> Response:
         """Handle DELETE request for todo delete."""
-        todo = self.get_object(todo_id)
-        if not todo:
+        # Delete the todo (and its cascades) without loading it first.
+        deleted, _ = Todo.objects.filter(id=todo_id).delete()
+        if not deleted:
             return failure_response(
                 message="Todo not found",
                 errors={"todo": ["Todo with this id does not exist"]},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        # Delete todo object
-        todo.delete()
         return success_response(
             message="Todo deleted successfully",
             data={},